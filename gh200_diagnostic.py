@@ -10,6 +10,7 @@ expected Unified Virtual Memory behaviour.
 from __future__ import annotations
 
 import argparse
+import ctypes
 import json
 import os
 import subprocess
@@ -21,9 +22,11 @@ from typing import Dict, List
 import psutil
 import torch
 
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 
 def _truthy(value: str | None) -> bool:
-    return bool(value and value.strip().lower() in {"1", "true", "yes", "on"})
+    return bool(value and value.strip().lower() in _TRUTHY)
 
 
 def check_uvm_env() -> Dict[str, object]:
@@ -82,6 +85,20 @@ def gather_system_info() -> Dict[str, object]:
     return info
 
 
+def _timed_fill(tensor: torch.Tensor, value: int) -> float:
+    start = time.perf_counter_ns()
+    tensor.fill_(value)
+    torch.cuda.synchronize()
+    return (time.perf_counter_ns() - start) / 1e9
+
+
+def _clear_cuda_error() -> None:
+    """Reset the runtime's sticky last error so the next kernel launch check does not report it."""
+    clear_error = getattr(ctypes.CDLL(None), "cudaGetLastError", None)
+    if clear_error is not None:
+        clear_error()
+
+
 def test_uvm_allocation(scale: float = 1.2) -> Dict[str, object]:
     results: Dict[str, object] = {"requested_scale": scale}
     if not torch.cuda.is_available():
@@ -95,7 +112,7 @@ def test_uvm_allocation(scale: float = 1.2) -> Dict[str, object]:
     torch.cuda.empty_cache()
     torch.cuda.synchronize()
 
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         tensor = torch.empty(target_bytes, dtype=torch.uint8, device="cuda")
     except RuntimeError as exc:
@@ -103,7 +120,7 @@ def test_uvm_allocation(scale: float = 1.2) -> Dict[str, object]:
         results["error"] = str(exc)
         return results
 
-    alloc_time = time.time() - start
+    alloc_time = (time.perf_counter_ns() - start) / 1e9
 
     results.update(
         {
@@ -113,12 +130,31 @@ def test_uvm_allocation(scale: float = 1.2) -> Dict[str, object]:
         }
     )
 
-    fill_start = time.time()
-    tensor.fill_(0x42)
-    torch.cuda.synchronize()
-    fill_time = time.time() - fill_start
-
-    results["fill_bandwidth_gbps"] = round((tensor.numel() / (1024**3)) / fill_time, 2) if fill_time else None
+    # The first fill pays on-demand page migration; the second measures
+    # steady-state bandwidth once pages are resident.
+    cold_fill_time = _timed_fill(tensor, 0x42)
+
+    cudart = torch.cuda.cudart() if hasattr(torch.cuda, "cudart") else None
+    prefetched = False
+    prefetch_failed = False
+    if hasattr(cudart, "cudaMemPrefetchAsync"):
+        # The binding returns an error code rather than raising.
+        try:
+            torch.cuda.check_error(cudart.cudaMemPrefetchAsync(tensor.data_ptr(), tensor.numel(), device))
+            torch.cuda.synchronize()
+            prefetched = True
+        except RuntimeError as exc:
+            # e.g. the allocator is not handing out managed memory.
+            _clear_cuda_error()
+            prefetch_failed = True
+            results["prefetch_error"] = str(exc)
+    # A warm fill after a failed prefetch would be reported as warm without being so.
+    warm_fill_time = None if prefetch_failed else _timed_fill(tensor, 0x43)
+
+    size_gb = tensor.numel() / (1024**3)
+    results["cold_fill_gbps"] = round(size_gb / cold_fill_time, 2) if cold_fill_time else None
+    results["warm_fill_gbps"] = round(size_gb / warm_fill_time, 2) if warm_fill_time else None
+    results["warm_fill_prefetched"] = prefetched
 
     del tensor
     torch.cuda.empty_cache()
@@ -180,7 +216,8 @@ def main(argv: List[str] | None = None) -> int:
         if allocation.get("status") == "success":
             print(
                 f"  Allocated {allocation['allocated_gb']} GB in {allocation['allocation_time_s']}s "
-                f"(fill bandwidth ≈ {allocation['fill_bandwidth_gbps']} GB/s)"
+                f"(fill bandwidth ≈ {allocation['cold_fill_gbps']} GB/s cold, "
+                f"{allocation['warm_fill_gbps']} GB/s warm)"
             )
         else:
             print(f"  Error: {allocation.get('error')}")
@@ -199,6 +199,7 @@ base_deps = [
     "torchmetrics>=1.1.1",
     "colorama>=0.4.6",
     "numpy>=2.2.0",
+    "orjson>=3.9.0",
     "peft>=0.17.0",
     "tensorboard>=2.18.0",
     "sentencepiece>=0.2.0",
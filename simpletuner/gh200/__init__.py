@@ -7,6 +7,7 @@ Unified Virtual Memory (UVM) features.
 """
 
 from .uvm import (
+    apply_cpu_residency_many,
     gh200_uvm_enabled,
     prefer_cpu_residency,
     prefer_gpu_residency,
@@ -17,6 +18,7 @@ from .uvm import (
 from .in_memory_backend import GH200InMemoryBackend
 
 __all__ = [
+    "apply_cpu_residency_many",
     "gh200_uvm_enabled",
     "prefer_cpu_residency",
     "prefer_gpu_residency",
@@ -4,9 +4,7 @@ from __future__ import annotations
 
 from typing import Mapping, Sequence
 
-import torch
-
-from .uvm import gh200_uvm_enabled, prefer_cpu_residency, prefetch_to_device
+from .uvm import _iter_tensors, apply_cpu_residency_many, gh200_uvm_enabled
 
 AUDIO_KEYS: Sequence[str] = (
     "audio_latents",
@@ -14,18 +12,13 @@ AUDIO_KEYS: Sequence[str] = (
     "audio_samples",
     "audio_features",
 )
+_AUDIO_KEY_SET = frozenset(AUDIO_KEYS)
+
 
 def apply_audio_uvm_hints(batch: Mapping[str, object]) -> None:
     """Give large audio tensors CPU residency hints when GH200 mode is active."""
     if not gh200_uvm_enabled():
         return
-    for key in AUDIO_KEYS:
-        value = batch.get(key)
-        if torch.is_tensor(value) and value.is_cuda:
-            prefer_cpu_residency(value)
-            prefetch_to_device(value)
-        elif isinstance(value, Mapping):
-            for nested in value.values():
-                if torch.is_tensor(nested) and nested.is_cuda:
-                    prefer_cpu_residency(nested)
-                    prefetch_to_device(nested)
+    apply_cpu_residency_many(
+        tensor for key, value in batch.items() if key in _AUDIO_KEY_SET for tensor in _iter_tensors(value)
+    )
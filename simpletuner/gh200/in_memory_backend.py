@@ -9,16 +9,23 @@ SimpleTuner so it can be dropped into existing configurations.
 
 from __future__ import annotations
 
-import json
 import logging
+import mmap
 import os
+import struct
+import sys
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
+import orjson
 import torch
 from PIL import Image
 
@@ -34,12 +41,153 @@ else:
 
 
 _DEFAULT_EXTENSIONS = tuple({ext.lower() for ext in image_file_extensions})
+# Files are read in batches so that each worker task covers many files,
+# amortising executor bookkeeping over hundreds of ``preadv`` calls.
+_READ_BATCH_SIZE = 1024
+# Minimum number of batches queued per worker, so every worker stays busy
+# compressing even when the dataset is only a few batches long.
+_BATCHES_PER_WORKER = 4
+# zstd dictionary training budget: sample up to this many bytes of payloads.
+_ZSTD_DICT_SAMPLE_BYTES = 100 * 1024 * 1024
+_ZSTD_DICT_SIZE = 128 * 1024
+_ZSTD_LEVEL = 3
+# Number of storage keys serialised per write when streaming metadata snapshots.
+_SNAPSHOT_CHUNK_SIZE = 65536
+
+
+def _allocate_arena(nbytes: int) -> torch.Tensor:
+    """
+    Allocate the staging arena as a uint8 tensor, page-locking it when CUDA is present.
+
+    The arena is an anonymous mapping advised for transparent huge pages before
+    it is first touched, so streaming decodes over it take far fewer dTLB misses
+    than with 4KB pages.  The pages are registered with ``cudaHostRegister``
+    rather than allocated via ``pin_memory=True`` because the caching host
+    allocator rounds requests up to the next power of two, which would inflate a
+    multi-hundred-GB dataset.
+    """
 
-
-def _resolve_compression(name: Optional[str]):
+    if not nbytes:
+        return torch.empty(0, dtype=torch.uint8)
+
+    mapping = mmap.mmap(-1, nbytes, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+    # The madvise constants only exist on Linux; elsewhere the mapping is used as-is.
+    if hasattr(mmap, "MADV_HUGEPAGE"):
+        mapping.madvise(mmap.MADV_HUGEPAGE)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mapping.madvise(mmap.MADV_WILLNEED)
+    # The tensor holds a buffer export of the mapping, keeping it alive.
+    arena = torch.frombuffer(mapping, dtype=torch.uint8)
+    if torch.cuda.is_available():
+        try:
+            torch.cuda.check_error(torch.cuda.cudart().cudaHostRegister(arena.data_ptr(), nbytes, 0))
+        except RuntimeError as exc:
+            # Page-locking can be refused by RLIMIT_MEMLOCK in containers, and forked
+            # workers cannot re-initialise CUDA at all; pageable memory still works.
+            # torch.cuda.CudaError is a RuntimeError, so both cases land here.
+            logger.warning("%s cudaHostRegister failed, arena stays pageable: %s", rank_info(), exc)
+        else:
+            weakref.finalize(arena, torch.cuda.cudart().cudaHostUnregister, arena.data_ptr())
+    return arena
+
+
+# Plain strided tensors are stored as a raw buffer behind a 16-byte header
+# (magic, dtype code, ndim, padding, numel) followed by int64 dims, which
+# skips torch.save's pickle + zip container.  Codes index _PACKED_DTYPES.
+_PACKED_TENSOR_MAGIC = b"STPT"
+_PACKED_TENSOR_HEADER = struct.Struct("<4sBBHQ")
+_PACKED_DTYPES = (
+    torch.float32,
+    torch.float16,
+    torch.bfloat16,
+    torch.float64,
+    torch.uint8,
+    torch.int8,
+    torch.int16,
+    torch.int32,
+    torch.int64,
+    torch.bool,
+)
+_PACKED_DTYPE_CODES = {dtype: code for code, dtype in enumerate(_PACKED_DTYPES)}
+
+
+def _serialize_tensor(tensor: torch.Tensor) -> bytes:
+    """Serialise ``tensor``, packing it raw when no torch.save metadata would be lost."""
+    code = _PACKED_DTYPE_CODES.get(tensor.dtype)
+    if (
+        type(tensor) is not torch.Tensor
+        or code is None
+        or tensor.layout != torch.strided
+        or tensor.requires_grad
+        # The header stores ndim in a single byte.
+        or tensor.dim() > 255
+    ):
+        buffer = BytesIO()
+        torch.save(tensor, buffer)
+        return buffer.getvalue()
+    return _pack_tensor(tensor, code)
+
+
+def _pack_tensor(tensor: torch.Tensor, code: int) -> bytes:
+    tensor = tensor.detach().to("cpu").contiguous()
+    header = _PACKED_TENSOR_HEADER.pack(_PACKED_TENSOR_MAGIC, code, tensor.dim(), 0, tensor.numel())
+    dims = struct.pack(f"<{tensor.dim()}q", *tensor.shape)
+    return b"".join((header, dims, memoryview(tensor.reshape(-1).view(torch.uint8).numpy())))
+
+
+def _unpack_tensor(payload) -> torch.Tensor:
+    _, code, ndim, _, numel = _PACKED_TENSOR_HEADER.unpack_from(payload)
+    shape = struct.unpack_from(f"<{ndim}q", payload, _PACKED_TENSOR_HEADER.size)
+    dtype = _PACKED_DTYPES[code]
+    if not numel:
+        return torch.empty(shape, dtype=dtype)
+    # Copy once so callers may modify the tensor without touching stored bytes.
+    data = bytearray(memoryview(payload)[_PACKED_TENSOR_HEADER.size + 8 * ndim :])
+    return torch.frombuffer(data, dtype=dtype, count=numel).reshape(shape)
+
+
+def _read_into(path: str, view: memoryview) -> None:
+    """Fill ``view`` with the leading bytes of ``path`` without intermediate copies."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        filled = 0
+        while filled < len(view):
+            count = os.preadv(fd, [view[filled:]], filled)
+            if count == 0:
+                raise OSError(f"Short read from {path}: expected {len(view)} bytes, got {filled}.")
+            filled += count
+    finally:
+        os.close(fd)
+
+
+class _ZstdCodec:
+    """zstd codec keeping one (de)compressor per thread, optionally primed with a trained dictionary."""
+
+    def __init__(self, zstandard, dict_data: Optional[bytes] = None) -> None:
+        self._zstandard = zstandard
+        self._dict = zstandard.ZstdCompressionDict(dict_data) if dict_data else None
+        self._local = threading.local()
+
+    def compress(self, data) -> bytes:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = self._zstandard.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=self._dict)
+        return compressor.compress(data)
+
+    def decompress(self, data) -> bytes:
+        # Frames carry their content size, so the output is allocated once at the right size.
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = self._zstandard.ZstdDecompressor(dict_data=self._dict)
+        return decompressor.decompress(data)
+
+
+def _resolve_compression(name: Optional[str], dict_data: Optional[bytes] = None):
     if not name:
         return None, None, "none"
     normalized = name.strip().lower()
+    if normalized == "none":
+        return None, None, "none"
     if normalized == "zlib":
         import zlib
 
@@ -58,9 +206,79 @@ def _resolve_compression(name: Optional[str]):
             raise RuntimeError("Compression library 'snappy' is not installed.") from exc
 
         return snappy.compress, snappy.decompress, "snappy"
+    if normalized == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("Compression library 'zstandard' is not installed.") from exc
+
+        codec = _ZstdCodec(zstandard, dict_data)
+        return codec.compress, codec.decompress, "zstd"
     raise ValueError(f"Unknown compression library: {name}")
 
 
+def _resolve_decoder(name: Optional[str]):
+    if not name:
+        return None, "pil"
+    normalized = name.strip().lower()
+    if normalized == "pil":
+        return None, "pil"
+    if normalized == "turbojpeg":
+        try:
+            import turbojpeg
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("Image decoder 'turbojpeg' is not installed.") from exc
+
+        return turbojpeg, "turbojpeg"
+    raise ValueError(f"Unknown image decoder: {name}")
+
+
+def _jpeg_exif(payload) -> Optional[bytes]:
+    """Return the raw APP1 EXIF block of a JPEG payload so orientation survives decoding."""
+    view = memoryview(payload)
+    pos = 2
+    while pos + 4 <= len(view) and view[pos] == 0xFF:
+        marker = view[pos + 1]
+        if marker == 0xDA:  # start of scan, no further metadata segments
+            break
+        length = int.from_bytes(view[pos + 2 : pos + 4], "big")
+        if marker == 0xE1 and view[pos + 4 : pos + 10] == b"Exif\x00\x00":
+            return bytes(view[pos + 4 : pos + 2 + length])
+        pos += 2 + length
+    return None
+
+
+def _key_extension(key: str) -> str:
+    return sys.intern(os.path.splitext(key)[1][1:].lower())
+
+
+class _ListingIndex(NamedTuple):
+    keys: np.ndarray
+    extension_codes: Dict[str, int]
+    suffix_codes: np.ndarray
+    parents: np.ndarray
+    parent_codes: np.ndarray
+
+
+def _available_ram_bytes() -> int:
+    """
+    Return the kernel's ``MemAvailable`` estimate.
+
+    Unlike free pages, this counts reclaimable page cache, which staging has
+    just filled with the whole dataset.
+    """
+
+    try:
+        with open("/proc/meminfo", "rb") as handle:
+            for line in handle:
+                if line.startswith(b"MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Non-Linux hosts have no /proc/meminfo; free pages are the closest estimate.
+    return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+
 class GH200InMemoryBackend(BaseDataBackend):
     """
     *Experimental*: data backend that stages an entire dataset in RAM.
@@ -76,22 +294,60 @@ class GH200InMemoryBackend(BaseDataBackend):
         compression: Optional[str] = None,
         memory_limit_gb: Optional[float] = None,
         num_workers: int = 16,
+        decoder: Optional[str] = None,
+        compression_dict: Optional[bytes] = None,
+        decompressed_cache_gb: Optional[float] = None,
     ) -> None:
         self.accelerator = accelerator
         self.id = id
         self.type = "in_memory"
         self.instance_data_dir = Path(instance_data_dir)
+        # Cached so key <-> absolute path conversion is plain string slicing.
+        self._instance_data_prefix = str(self.instance_data_dir) + os.sep
         self._file_extensions = tuple(ext.lower().lstrip(".") for ext in (file_extensions or _DEFAULT_EXTENSIONS))
-        self._compress_fn, self._decompress_fn, self._compression_name = _resolve_compression(compression)
+        self._compression_dict = compression_dict
+        self._compress_fn, self._decompress_fn, self._compression_name = _resolve_compression(compression, compression_dict)
         self._memory_limit_bytes = None if memory_limit_gb is None else int(memory_limit_gb * (1024**3))
         self._num_workers = max(1, num_workers)
-        self._storage: Dict[str, bytes] = {}
+        self._turbojpeg, self._decoder_name = _resolve_decoder(decoder)
+        self._thread_state = threading.local()
+        self._decode_executor: Optional[ThreadPoolExecutor] = None
+        # Entries are stored as parallel per-slot arrays.  A slot whose payload is
+        # ``None`` lives in the arena at ``_offsets[i]:_offsets[i] + _sizes[i]``;
+        # otherwise ``_payloads[i]`` holds the (possibly compressed) bytes.
+        # Deleted slots have their key set to ``None`` and are never reused.
+        self._keys: List[Optional[str]] = []
+        self._key_index: Dict[str, int] = {}
+        self._payloads: List[Optional[bytes]] = []
+        self._extensions: List[str] = []
+        self._offsets = np.zeros(0, dtype=np.int64)
+        self._sizes = np.zeros(0, dtype=np.int64)
+        # Vectorised view of the slots used by ``list_files``; rebuilt lazily after slots change.
+        self._listing: Optional[_ListingIndex] = None
+        self._arena_tensor: Optional[torch.Tensor] = None
+        self._arena = None
+        self._raw_bytes = 0
+        # Decompressed payloads are kept in an LRU so repeat epochs skip the codec.
+        self._decompressed_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._decompressed_cache_bytes = 0
+        self._decompressed_cache_gb = decompressed_cache_gb
         self._lock = threading.RLock()
 
         if not self.instance_data_dir.exists():
             raise FileNotFoundError(f"Instance data directory '{self.instance_data_dir}' does not exist.")
 
         self._load_dataset()
+        # ``_key_index`` is only replaced during loading, so membership probes can
+        # go straight to the dict without a Python-level frame per call.
+        self.exists = self._key_index.__contains__
+        if not self._decompress_fn:
+            # Without a codec, reads skip the decompression dispatch entirely.
+            self.read = self._read_raw
+            self._decompressed_cache_limit = 0
+        elif decompressed_cache_gb is None:
+            self._decompressed_cache_limit = min(self._raw_bytes, _available_ram_bytes() // 4)
+        else:
+            self._decompressed_cache_limit = int(decompressed_cache_gb * (1024**3))
 
     # ------------------------------------------------------------------
     # BaseDataBackend compliance
@@ -103,8 +359,11 @@ class GH200InMemoryBackend(BaseDataBackend):
             "instance_data_dir": str(self.instance_data_dir),
             "file_extensions": list(self._file_extensions),
             "compression": self._compression_name,
+            "compression_dict": self._compression_dict,
             "memory_limit_gb": None if self._memory_limit_bytes is None else self._memory_limit_bytes / (1024**3),
             "num_workers": self._num_workers,
+            "decoder": self._decoder_name,
+            "decompressed_cache_gb": self._decompressed_cache_gb,
         }
 
     @staticmethod
@@ -120,12 +379,37 @@ class GH200InMemoryBackend(BaseDataBackend):
             compression=representation.get("compression"),
             memory_limit_gb=representation.get("memory_limit_gb"),
             num_workers=representation.get("num_workers", 16),
+            decoder=representation.get("decoder"),
+            compression_dict=representation.get("compression_dict"),
+            decompressed_cache_gb=representation.get("decompressed_cache_gb"),
         )
 
     def read(self, identifier: str, as_byte_io: bool = False):
-        data = self._storage[identifier]
-        payload = self._decompress_fn(data) if self._decompress_fn else data
-        return BytesIO(payload) if as_byte_io else payload
+        payload = self._payload(identifier)
+        if as_byte_io:
+            return BytesIO(payload)
+        # Arena-backed entries are memoryviews; callers expect ``bytes``.
+        return bytes(payload)
+
+    def read_tensor(self, identifier: str, device="cuda") -> torch.Tensor:
+        """
+        Return the stored bytes of ``identifier`` as a uint8 tensor on ``device``.
+
+        Arena-backed entries are copied straight out of page-locked memory, so the
+        host-to-device transfer is asynchronous on the current stream.
+        """
+
+        index = self._key_index[identifier]
+        if self._payloads[index] is None:
+            offset = int(self._offsets[index])
+            host = self._arena_tensor[offset : offset + int(self._sizes[index])]
+        else:
+            host = torch.frombuffer(bytearray(self._payload(identifier)), dtype=torch.uint8)
+        return host.to(device, non_blocking=True)
+
+    def as_bytes_view(self, identifier: str) -> memoryview:
+        """Return a read-only view of the stored bytes, without copying arena-backed entries."""
+        return memoryview(self._payload(identifier)).toreadonly()
 
     def write(self, identifier: str, data: Any):
         if isinstance(data, BytesIO):
@@ -133,40 +417,64 @@ class GH200InMemoryBackend(BaseDataBackend):
         elif isinstance(data, bytes):
             payload = data
         elif isinstance(data, torch.Tensor):
-            buffer = BytesIO()
-            torch.save(data, buffer)
-            payload = buffer.getvalue()
+            payload = _serialize_tensor(data)
         else:
             raise TypeError(f"Unsupported data type for write: {type(data)}")
         if self._compress_fn:
             payload = self._compress_fn(payload)
         with self._lock:
-            self._storage[identifier] = payload
+            index = self._key_index.get(identifier)
+            if index is None:
+                self._key_index[identifier] = len(self._keys)
+                self._keys.append(identifier)
+                self._payloads.append(payload)
+                self._extensions.append(_key_extension(identifier))
+                self._listing = None
+            else:
+                self._payloads[index] = payload
+            self._evict_decompressed(identifier)
 
     def delete(self, identifier: str):
         with self._lock:
-            self._storage.pop(identifier, None)
+            index = self._key_index.pop(identifier, None)
+            if index is not None:
+                self._keys[index] = None
+                self._extensions[index] = ""
+                if self._payloads[index] is not None:
+                    self._payloads[index] = b""
+                self._listing = None
+            self._evict_decompressed(identifier)
 
     def exists(self, identifier: str) -> bool:
-        return identifier in self._storage
+        return identifier in self._key_index
 
     def open_file(self, identifier: str, mode: str):
-        if "r" in mode and identifier in self._storage:
-            payload = self._storage[identifier]
-            data = self._decompress_fn(payload) if self._decompress_fn else payload
-            return BytesIO(data)
+        if "r" in mode and identifier in self._key_index:
+            return BytesIO(self._payload(identifier))
         raise NotImplementedError("GH200InMemoryBackend only supports reading staged files.")
 
     def list_files(self, file_extensions: List[str], instance_data_dir: str = "") -> List[Tuple[str, List, List[str]]]:
-        results: Dict[str, List[str]] = {}
-        extensions = set(ext.lower().lstrip(".") for ext in (file_extensions or self._file_extensions))
-        for rel_path in self._storage.keys():
-            path_obj = Path(rel_path)
-            if extensions and path_obj.suffix.lower().lstrip(".") not in extensions:
-                continue
-            parent = str(path_obj.parent)
-            results.setdefault(parent, []).append(str(self.instance_data_dir / path_obj))
-        return [(folder, [], files) for folder, files in results.items()]
+        listing = self._listing_index()
+        extensions = [ext.lower().lstrip(".") for ext in (file_extensions or self._file_extensions)]
+        if extensions:
+            wanted = [listing.extension_codes[ext] for ext in extensions if ext in listing.extension_codes]
+            selected = np.flatnonzero(np.isin(listing.suffix_codes, wanted))
+        else:
+            selected = np.flatnonzero(listing.suffix_codes >= 0)
+        if not len(selected):
+            return []
+
+        # Bucket the selected slots by parent directory in a single stable sort.
+        selected = selected[np.argsort(listing.parent_codes[selected], kind="stable")]
+        boundaries = np.flatnonzero(np.diff(listing.parent_codes[selected])) + 1
+        prefix = self._instance_data_prefix
+        results = []
+        for group in np.split(selected, boundaries):
+            folder = listing.parents[listing.parent_codes[group[0]]]
+            # Keys written by a path outside the root are stored absolute and returned as-is.
+            files = [key if os.path.isabs(key) else prefix + key for key in listing.keys[group]]
+            results.append((folder, [], files))
+        return results
 
     def get_abs_path(self, sample_path: str = None) -> str:
         if sample_path is None:
@@ -178,16 +486,50 @@ class GH200InMemoryBackend(BaseDataBackend):
     def read_image(self, filepath: str, delete_problematic_images: bool = False):
         rel_path = self._relative_key(filepath)
         try:
-            payload = self.read(rel_path)
+            payload = self._payload(rel_path)
         except KeyError:
             raise FileNotFoundError(filepath)
-        buffer = BytesIO(payload)
-        image = Image.open(buffer)
+        if self._turbojpeg is not None and payload[:2] == b"\xff\xd8":
+            try:
+                pixels = self._thread_turbojpeg().decode(payload, pixel_format=self._turbojpeg.TJPF_RGB)
+            except OSError as exc:
+                # libjpeg-turbo cannot convert some colourspaces (e.g. CMYK) to RGB; PIL can.
+                logger.debug("%s turbojpeg could not decode %s, using PIL: %s", rank_info(), filepath, exc)
+            else:
+                image = Image.fromarray(pixels)
+                exif = _jpeg_exif(payload)
+                if exif is not None:
+                    image.info["exif"] = exif
+                return image
+        image = Image.open(BytesIO(payload))
         image.load()
         return image
 
-    def read_image_batch(self, filepaths: Iterable[str], delete_problematic_images: bool = False):
-        return [self.read_image(path, delete_problematic_images) for path in filepaths]
+    def read_image_batch(
+        self, filepaths: Iterable[str], delete_problematic_images: bool = False
+    ) -> Tuple[List[str], List[Any]]:
+        # Both PIL and libjpeg-turbo release the GIL while decoding, so a batch
+        # decodes in parallel across the Grace cores.
+        if self._decode_executor is None:
+            with self._lock:
+                if self._decode_executor is None:
+                    self._decode_executor = ThreadPoolExecutor(
+                        max_workers=os.cpu_count(), thread_name_prefix=f"{self.id}-decode"
+                    )
+        filepaths = list(filepaths)
+        available_keys = []
+        output_images = []
+        for filepath, (image, error) in zip(filepaths, self._decode_executor.map(self._try_read_image, filepaths)):
+            if error is None:
+                available_keys.append(filepath)
+                output_images.append(image)
+            elif delete_problematic_images:
+                logger.error(f"Deleting image '{filepath}', because --delete_problematic_images is provided. Error: {error}")
+                self.delete(self._relative_key(filepath))
+            else:
+                log_level = logging.WARNING if should_log() else logging.DEBUG
+                logger.log(log_level, f"Unable to load image '{filepath}', skipping. Error: {error}")
+        return available_keys, output_images
 
     def create_directory(self, directory_path):
         # No-op: data lives in-memory.
@@ -195,49 +537,149 @@ class GH200InMemoryBackend(BaseDataBackend):
 
     def torch_load(self, filename):
         rel_path = self._relative_key(filename)
-        payload = self.read(rel_path)
-        buffer = BytesIO(payload)
-        return torch.load(buffer, map_location="cpu")
+        payload = self._payload(rel_path)
+        if payload[: len(_PACKED_TENSOR_MAGIC)] == _PACKED_TENSOR_MAGIC:
+            return _unpack_tensor(payload)
+        return torch.load(BytesIO(payload), map_location="cpu")
 
     def torch_save(self, data, filename):
-        buffer = BytesIO()
-        torch.save(data, buffer)
-        self.write(self._relative_key(filename), buffer.getvalue())
+        if isinstance(data, torch.Tensor):
+            payload = _serialize_tensor(data)
+        else:
+            buffer = BytesIO()
+            torch.save(data, buffer)
+            payload = buffer.getvalue()
+        self.write(self._relative_key(filename), payload)
 
     def write_batch(self, identifiers, files):
         for identifier, payload in zip(identifiers, files):
-            if isinstance(payload, torch.Tensor):
-                buffer = BytesIO()
-                torch.save(payload, buffer)
-                self.write(self._relative_key(identifier), buffer.getvalue())
-            else:
-                self.write(self._relative_key(identifier), payload)
+            self.write(self._relative_key(identifier), payload)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _relative_key(self, path: str) -> str:
-        path_obj = Path(path)
+    def _listing_index(self) -> _ListingIndex:
+        listing = self._listing
+        if listing is not None:
+            return listing
+        with self._lock:
+            extension_codes: Dict[str, int] = {}
+            suffix_codes = np.fromiter(
+                (
+                    -1 if key is None else extension_codes.setdefault(extension, len(extension_codes))
+                    for key, extension in zip(self._keys, self._extensions)
+                ),
+                dtype=np.int64,
+                count=len(self._keys),
+            )
+            parents, parent_codes = np.unique(
+                np.array([os.path.dirname(key or "") or "." for key in self._keys], dtype=object),
+                return_inverse=True,
+            )
+            listing = _ListingIndex(
+                keys=np.array(self._keys, dtype=object),
+                extension_codes=extension_codes,
+                suffix_codes=suffix_codes,
+                parents=parents,
+                parent_codes=parent_codes.reshape(-1),
+            )
+            self._listing = listing
+        return listing
+
+    def _raw_payload(self, identifier: str):
+        index = self._key_index[identifier]
+        entry = self._payloads[index]
+        if entry is None:
+            offset = int(self._offsets[index])
+            return memoryview(self._arena)[offset : offset + int(self._sizes[index])]
+        return entry
+
+    def _read_raw(self, identifier: str, as_byte_io: bool = False):
+        # Both branches copy arena-backed entries; as_bytes_view() is the zero-copy path.
+        payload = self._raw_payload(identifier)
+        if as_byte_io:
+            return BytesIO(payload)
+        return bytes(payload)
+
+    def _payload(self, identifier: str):
+        entry = self._raw_payload(identifier)
+        if not self._decompress_fn:
+            return entry
+
+        with self._lock:
+            cached = self._decompressed_cache.get(identifier)
+            if cached is not None:
+                self._decompressed_cache.move_to_end(identifier)
+                return cached
+        payload = self._decompress_fn(entry)
+        if len(payload) <= self._decompressed_cache_limit:
+            with self._lock:
+                current = self._key_index.get(identifier)
+                if current is not None and self._payloads[current] is entry and identifier not in self._decompressed_cache:
+                    self._decompressed_cache[identifier] = payload
+                    self._decompressed_cache_bytes += len(payload)
+                    while self._decompressed_cache_bytes > self._decompressed_cache_limit:
+                        _, evicted = self._decompressed_cache.popitem(last=False)
+                        self._decompressed_cache_bytes -= len(evicted)
+        return payload
+
+    def _evict_decompressed(self, identifier: str) -> None:
+        evicted = self._decompressed_cache.pop(identifier, None)
+        if evicted is not None:
+            self._decompressed_cache_bytes -= len(evicted)
+
+    def _try_read_image(self, filepath: str) -> Tuple[Optional[Any], Optional[Exception]]:
         try:
-            return str(path_obj.relative_to(self.instance_data_dir))
-        except ValueError:
-            return str(path_obj)
-
-    def _gather_files(self) -> List[Path]:
-        extensions = {f".{ext}" for ext in self._file_extensions}
-        files: List[Path] = []
-        for extension in extensions:
-            files.extend(self.instance_data_dir.rglob(f"*{extension}"))
-            files.extend(self.instance_data_dir.rglob(f"*{extension.upper()}"))
-        return sorted({path.resolve() for path in files})
+            return self.read_image(filepath), None
+        except Exception as exc:
+            return None, exc
+
+    def _thread_turbojpeg(self):
+        decoder = getattr(self._thread_state, "turbojpeg", None)
+        if decoder is None:
+            decoder = self._thread_state.turbojpeg = self._turbojpeg.TurboJPEG()
+        return decoder
+
+    def _relative_key(self, path: str) -> str:
+        path = os.fspath(path)
+        prefix = self._instance_data_prefix
+        return path[len(prefix) :] if path.startswith(prefix) else path
+
+    def _gather_files(self) -> Tuple[List[str], List[str], List[int]]:
+        """
+        Walk ``instance_data_dir`` once, returning parallel lists of absolute
+        paths, storage keys and file sizes for every matching file.
+        """
+
+        extensions = frozenset(self._file_extensions)
+        found: List[Tuple[str, str, int]] = []
+        pending = [(str(self.instance_data_dir), "")]
+        while pending:
+            directory, rel_dir = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = f"{rel_dir}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, f"{rel_path}{os.sep}"))
+                        continue
+                    # splitext, as in _key_extension, so names like "png" or ".png" have no extension.
+                    if os.path.splitext(entry.name)[1][1:].lower() in extensions and entry.is_file():
+                        found.append((rel_path, entry.path, entry.stat().st_size))
+
+        found.sort()
+        keys = [rel_path for rel_path, _, _ in found]
+        paths = [path for _, path, _ in found]
+        sizes = [size for _, _, size in found]
+        return paths, keys, sizes
 
     def _load_dataset(self) -> None:
-        files = self._gather_files()
+        files, keys, sizes = self._gather_files()
         if not files:
             logger.warning("%s No files discovered under %s", rank_info(), self.instance_data_dir)
             return
 
-        total_bytes = sum(path.stat().st_size for path in files)
+        total_bytes = sum(sizes)
+        self._raw_bytes = total_bytes
         if self._memory_limit_bytes and total_bytes > self._memory_limit_bytes:
             raise MemoryError(
                 f"Dataset requires {total_bytes / (1024 ** 3):.1f} GB but the limit is "
@@ -254,39 +696,115 @@ class GH200InMemoryBackend(BaseDataBackend):
             self._num_workers,
         )
 
+        # Uncompressed payloads are read straight into one pre-sized arena and
+        # addressed by (offset, size) slots.  Compressed payloads are read into
+        # a per-batch scratch buffer instead, since only the output is kept.
+        offsets = list(accumulate(sizes, initial=0))
+        self._keys = list(keys)
+        self._key_index = {key: index for index, key in enumerate(keys)}
+        self._payloads = [None] * len(keys)
+        self._extensions = [_key_extension(key) for key in keys]
+        self._offsets = np.array(offsets[:-1], dtype=np.int64)
+        self._sizes = np.array(sizes, dtype=np.int64)
+        if self._compression_name == "zstd" and self._compression_dict is None:
+            self._train_zstd_dictionary(files, sizes, total_bytes)
+        if not self._compress_fn:
+            self._arena_tensor = _allocate_arena(total_bytes)
+            self._arena = self._arena_tensor.numpy()
+
         with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
-            futures = [executor.submit(self._load_single_file, path) for path in files]
+            batch_size = min(_READ_BATCH_SIZE, -(-len(files) // (self._num_workers * _BATCHES_PER_WORKER)))
+            futures = {
+                executor.submit(
+                    self._load_file_batch,
+                    files[first : first + batch_size],
+                    sizes[first : first + batch_size],
+                    offsets[first : first + batch_size],
+                ): first
+                for first in range(0, len(files), batch_size)
+            }
             for future in as_completed(futures):
-                rel_path, payload = future.result()
-                with self._lock:
-                    self._storage[rel_path] = payload
+                payloads = future.result()
+                if payloads is not None:
+                    first = futures[future]
+                    self._payloads[first : first + len(payloads)] = payloads
 
         elapsed = time.time() - start
         logger.info(
             "%s Finished staging %d files into memory in %.1fs (compression=%s).",
             rank_info(),
-            len(self._storage),
+            len(self._key_index),
             elapsed,
             self._compression_name,
         )
 
-    def _load_single_file(self, path: Path) -> Tuple[str, bytes]:
-        with path.open("rb") as handle:
-            payload = handle.read()
-        if self._compress_fn:
-            payload = self._compress_fn(payload)
-        rel_path = str(path.relative_to(self.instance_data_dir))
-        return rel_path, payload
+    def _train_zstd_dictionary(self, files: Sequence[str], sizes: Sequence[int], total_bytes: int) -> None:
+        import zstandard
+
+        stride = max(1, -(-total_bytes // _ZSTD_DICT_SAMPLE_BYTES))
+        samples = []
+        for path, size in zip(files[::stride], sizes[::stride]):
+            sample = bytearray(size)
+            _read_into(path, memoryview(sample))
+            samples.append(bytes(sample))
+        try:
+            dictionary = zstandard.train_dictionary(_ZSTD_DICT_SIZE, samples)
+        except zstandard.ZstdError as exc:
+            # Small datasets do not provide enough samples to train a dictionary.
+            logger.warning("%s zstd dictionary training skipped for %s: %s", rank_info(), self.id, exc)
+            return
+
+        self._compression_dict = dictionary.as_bytes()
+        self._compress_fn, self._decompress_fn, _ = _resolve_compression("zstd", self._compression_dict)
+        logger.info(
+            "%s Trained %d KB zstd dictionary for %s from %d samples.",
+            rank_info(),
+            len(self._compression_dict) // 1024,
+            self.id,
+            len(samples),
+        )
+
+    def _load_file_batch(self, paths: Sequence[str], sizes: Sequence[int], offsets: Sequence[int]) -> Optional[List[bytes]]:
+        """Read one batch of files; returns the compressed payloads, or ``None`` when they landed in the arena."""
+        if self._arena is not None:
+            arena_view = memoryview(self._arena)
+            for path, size, offset in zip(paths, sizes, offsets):
+                _read_into(path, arena_view[offset : offset + size])
+            return None
+
+        scratch = memoryview(bytearray(max(sizes)))
+        payloads: List[bytes] = []
+        for path, size in zip(paths, sizes):
+            _read_into(path, scratch[:size])
+            payloads.append(self._compress_fn(scratch[:size]))
+        return payloads
 
     # ------------------------------------------------------------------
     # Metadata helpers
     # ------------------------------------------------------------------
     def write_metadata_snapshot(self, output_path: Path) -> None:
-        snapshot = {
-            "id": self.id,
-            "files": list(self._storage.keys()),
-            "compression": self._compression_name,
-            "instance_data_dir": str(self.instance_data_dir),
-            "timestamp": time.time(),
-        }
-        output_path.write_text(json.dumps(snapshot, indent=2))
+        header = orjson.dumps(
+            {
+                "id": self.id,
+                "compression": self._compression_name,
+                "instance_data_dir": str(self.instance_data_dir),
+                "timestamp": time.time(),
+            }
+        )
+        # Slots are only ever appended and deleted keys become ``None``, so the
+        # first ``count`` slots can be streamed without holding the lock that
+        # reads contend on.
+        with self._lock:
+            count = len(self._keys)
+        # The file list is streamed in chunks instead of being materialised
+        # into a single document; the header is re-opened to append it.
+        with output_path.open("wb") as handle:
+            handle.write(header[:-1])
+            handle.write(b',"files":[')
+            keys = (key for key in islice(self._keys, count) if key is not None)
+            separator = b""
+            while chunk := list(islice(keys, _SNAPSHOT_CHUNK_SIZE)):
+                handle.write(separator)
+                handle.write(orjson.dumps(chunk)[1:-1])
+                separator = b","
+            handle.write(b"]}")
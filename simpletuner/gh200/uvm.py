@@ -8,15 +8,45 @@ operations when both CUDA is available *and* the environment variable
 
 from __future__ import annotations
 
+import ctypes
 import logging
 import os
-from typing import Iterable, Mapping, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
 
 import torch
 
 logger = logging.getLogger("GH200UVM")
 
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 _UVM_HINT_OVERRIDE: Optional[bool] = None
+# Resolved flag; the environment is read once and only re-evaluated after
+# ``set_uvm_hint_override`` since the variable does not change mid-process.
+_UVM_ENABLED_CACHE: Optional[bool] = None
+
+# Managed memory migrates in 2MB pages; advising or prefetching anything
+# smaller costs a driver round-trip per call without moving a full page.
+_MIN_HINT_BYTES = 2 * 1024 * 1024
+
+# Batch keys holding text encoder outputs, which are kept resident on the GPU.
+_GPU_RESIDENT_KEYS = ("encoder_hidden_states", "text_embeddings", "pooled_prompt_embeds")
+
+
+class _CudartHandles(NamedTuple):
+    memory_advise: Optional[Callable]
+    advise: Optional[Callable]
+    prefetch: Optional[Callable[[int, int, int, int], None]]
+    prefetch_stream: Optional[torch.cuda.Stream]
+    preferred_location: Optional[int]
+    accessed_by: Optional[int]
+    cpu_device_id: int
+    device: int
+
+
+_CUDART_LOCK = threading.Lock()
+_CUDART_HANDLES: Optional[_CudartHandles] = None
+_CUDART_RESOLVED = False
 
 
 def gh200_uvm_enabled() -> bool:
@@ -24,13 +54,26 @@ def gh200_uvm_enabled() -> bool:
     Return ``True`` when GH200 specific behaviour should be enabled.
 
     Users must opt in explicitly to avoid touching CUDA runtime symbols on
-    machines that do not ship the patched PyTorch build.
+    machines that do not ship the patched PyTorch build.  The environment
+    variable is read once; use :func:`set_uvm_hint_override` to toggle the
+    behaviour at runtime.
     """
 
+    enabled = _UVM_ENABLED_CACHE
+    if enabled is None:
+        enabled = _resolve_uvm_enabled()
+    return enabled
+
+
+def _resolve_uvm_enabled() -> bool:
+    global _UVM_ENABLED_CACHE
     if _UVM_HINT_OVERRIDE is not None:
-        return _UVM_HINT_OVERRIDE
-    flag = os.environ.get("SIMPLETUNER_GH200_ENABLE_UVM_HINTS", "")
-    return flag.strip().lower() in {"1", "true", "yes", "on"}
+        enabled = _UVM_HINT_OVERRIDE
+    else:
+        flag = os.environ.get("SIMPLETUNER_GH200_ENABLE_UVM_HINTS", "")
+        enabled = flag.strip().lower() in _TRUTHY
+    _UVM_ENABLED_CACHE = enabled
+    return enabled
 
 
 def set_uvm_hint_override(value: Optional[bool]) -> None:
@@ -40,23 +83,18 @@ def set_uvm_hint_override(value: Optional[bool]) -> None:
     Passing ``None`` clears the override and restores environment-based behaviour.
     """
 
-    global _UVM_HINT_OVERRIDE
+    global _UVM_HINT_OVERRIDE, _UVM_ENABLED_CACHE
     _UVM_HINT_OVERRIDE = value
+    _UVM_ENABLED_CACHE = None
 
 
-def _element_span_bytes(tensor: torch.Tensor) -> int:
+def _storage_span(tensor: torch.Tensor) -> Tuple[int, int]:
+    """Return ``(data_ptr, nbytes)`` of the storage backing ``tensor``."""
     try:
         storage = tensor.untyped_storage()
-        nbytes = storage.nbytes()
-        if nbytes:
-            return int(nbytes)
-    except Exception:
-        pass
-
-    try:
-        return int(tensor.element_size() * tensor.numel())
+        return int(storage.data_ptr()), int(storage.nbytes())
     except Exception:
-        return 0
+        return 0, 0
 
 
 def _cudart():
@@ -75,52 +113,165 @@ def _current_cuda_device() -> int:
         return 0
 
 
-def _apply_preferred_location(tensor: torch.Tensor, *, prefer_cpu: bool) -> bool:
-    if not gh200_uvm_enabled():
-        return False
-    if not torch.cuda.is_available() or not tensor.is_cuda:
-        return False
+def _managed_allocation() -> bool:
+    """Return ``True`` when the patched allocator is configured to hand out managed memory."""
+    conf = os.environ.get("PYTORCH_CUDA_ALLOC_CONF", "")
+    for part in conf.split(","):
+        key, _, value = part.partition(":")
+        if key.strip().lower() == "use_uvm":
+            return value.strip().lower() in _TRUTHY
+    return False
 
-    try:
-        if hasattr(torch.cuda, "memory_advise"):
-            location = "cpu" if prefer_cpu else _current_cuda_device()
-            torch.cuda.memory_advise(tensor, "set_preferred_location", device=location)
-            torch.cuda.memory_advise(tensor, "set_accessed_by", device=_current_cuda_device())
-            return True
-    except Exception as exc:  # pragma: no cover - best effort
-        logger.debug("torch.cuda.memory_advise failed: %s", exc)
 
+def _load_stream_prefetch(cudart) -> Optional[Callable[[int, int, int, int], None]]:
+    """
+    Return a ``cudaMemPrefetchAsync(ptr, size, device, stream)`` callable.
+
+    Prefetching only applies to the patched build: stock PyTorch neither
+    exposes the binding nor allocates managed memory, and prefetching plain
+    ``cudaMalloc`` memory fails.  On the patched build the runtime symbol is
+    called through ctypes when it is globally visible (torch loads libcudart
+    through its RTLD_GLOBAL dependencies) because the cudart binding only
+    accepts the three-argument, default-stream form.  CUDA 13 replaced the
+    device argument with a ``cudaMemLocation``, so the symbol is only called
+    directly on CUDA 12 runtimes.
+    """
+
+    binding = getattr(cudart, "cudaMemPrefetchAsync", None)
+    if binding is None and not _managed_allocation():
+        return None
+
+    symbol = clear_error = None
+    if torch.version.cuda and int(torch.version.cuda.split(".")[0]) < 13:
+        runtime = ctypes.CDLL(None)
+        symbol = getattr(runtime, "cudaMemPrefetchAsync", None)
+        clear_error = getattr(runtime, "cudaGetLastError", None)
+    if symbol is not None and clear_error is not None:
+        symbol.argtypes = (ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_void_p)
+        symbol.restype = ctypes.c_int
+        clear_error.restype = ctypes.c_int
+
+        def prefetch(ptr: int, size: int, device: int, stream: int) -> None:
+            status = symbol(ptr, size, device, stream)
+            if status:
+                # The runtime records the failure as the thread's last error, which
+                # torch's next kernel launch check would report against that kernel.
+                clear_error()
+                torch.cuda.check_error(status)
+
+        return prefetch
+
+    if binding is None:
+        return None
+    logger.debug("cudaMemPrefetchAsync symbol not visible; prefetches use the default stream.")
+    return lambda ptr, size, device, stream: binding(ptr, size, device)
+
+
+def _load_cudart_handles() -> _CudartHandles:
     cudart = _cudart()
-    if cudart is None:
-        return False
+    device = _current_cuda_device()
+    prefetch = _load_stream_prefetch(cudart)
+    prefetch_stream = None
+    if prefetch is not None:
+        try:
+            # Prefetches run on their own stream so migration overlaps with compute.
+            prefetch_stream = torch.cuda.Stream(device=device)
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.debug("Failed to create prefetch stream, prefetching disabled: %s", exc)
+            prefetch = None
+    return _CudartHandles(
+        memory_advise=getattr(torch.cuda, "memory_advise", None),
+        advise=getattr(cudart, "cudaMemAdvise", None),
+        prefetch=prefetch,
+        prefetch_stream=prefetch_stream,
+        preferred_location=getattr(cudart, "cudaMemAdviseSetPreferredLocation", None),
+        accessed_by=getattr(cudart, "cudaMemAdviseSetAccessedBy", None),
+        cpu_device_id=getattr(cudart, "cudaCpuDeviceId", -1),
+        device=device,
+    )
+
+
+def _cudart_handles() -> _CudartHandles:
+    """
+    Resolve the CUDA runtime entry points and the active device once per process.
 
-    size = _element_span_bytes(tensor)
-    if size <= 0:
-        return False
+    Resolution is deferred to the first hint so that importing this module
+    never initialises CUDA.
+    """
 
-    try:
-        ptr = tensor.data_ptr()
-    except Exception:
+    global _CUDART_HANDLES, _CUDART_RESOLVED
+    if not _CUDART_RESOLVED:
+        with _CUDART_LOCK:
+            if not _CUDART_RESOLVED:
+                _CUDART_HANDLES = _load_cudart_handles()
+                _CUDART_RESOLVED = True
+    return _CUDART_HANDLES
+
+
+def _advise_span(handles: _CudartHandles, tensor: torch.Tensor, ptr: int, size: int, *, prefer_cpu: bool) -> bool:
+    if handles.memory_advise is not None:
         try:
-            ptr = tensor.storage().data_ptr()
-        except Exception:
-            return False
+            location = "cpu" if prefer_cpu else handles.device
+            handles.memory_advise(tensor, "set_preferred_location", device=location)
+            handles.memory_advise(tensor, "set_accessed_by", device=handles.device)
+            return True
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.debug("torch.cuda.memory_advise failed: %s", exc)
+
+    if handles.advise is None or handles.preferred_location is None or handles.accessed_by is None:
+        return False
 
     try:
-        advise = cudart.cudaMemAdvise
-        preferred_location = cudart.cudaMemAdviseSetPreferredLocation
-        accessed_by = cudart.cudaMemAdviseSetAccessedBy
-        cpu_id = getattr(cudart, "cudaCpuDeviceId", -1)
-
-        target = cpu_id if prefer_cpu else _current_cuda_device()
-        advise(ptr, size, preferred_location, target)
-        advise(ptr, size, accessed_by, _current_cuda_device())
+        target = handles.cpu_device_id if prefer_cpu else handles.device
+        handles.advise(ptr, size, handles.preferred_location, target)
+        handles.advise(ptr, size, handles.accessed_by, handles.device)
         return True
     except Exception as exc:  # pragma: no cover - best effort
         logger.debug("cudaMemAdvise failed: %s", exc)
         return False
 
 
+def _prefetch_span(handles: _CudartHandles, ptr: int, size: int, device: int) -> bool:
+    if handles.prefetch is None:
+        return False
+    try:
+        handles.prefetch(ptr, size, device, handles.prefetch_stream.cuda_stream)
+        return True
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.debug("cudaMemPrefetchAsync failed: %s", exc)
+        return False
+
+
+def _join_prefetch_stream(handles: _CudartHandles) -> None:
+    """
+    Make the current stream wait for issued prefetches.
+
+    Kernels already queued keep running while pages migrate; only kernels
+    enqueued after this point wait for the migration to finish.
+    """
+
+    torch.cuda.current_stream(handles.device).wait_stream(handles.prefetch_stream)
+
+
+def _hintable_span(tensor: torch.Tensor) -> Tuple[int, int]:
+    """Return the storage span of ``tensor``, or ``(0, 0)`` when it is not worth hinting."""
+    if not torch.cuda.is_available() or not tensor.is_cuda:
+        return 0, 0
+    ptr, size = _storage_span(tensor)
+    if size < _MIN_HINT_BYTES:
+        return 0, 0
+    return ptr, size
+
+
+def _apply_preferred_location(tensor: torch.Tensor, *, prefer_cpu: bool) -> bool:
+    if not gh200_uvm_enabled():
+        return False
+    ptr, size = _hintable_span(tensor)
+    if size <= 0:
+        return False
+    return _advise_span(_cudart_handles(), tensor, ptr, size, prefer_cpu=prefer_cpu)
+
+
 def prefer_cpu_residency(tensor: torch.Tensor) -> bool:
     """Hint the runtime to keep this CUDA tensor resident in CPU memory."""
     return _apply_preferred_location(tensor, prefer_cpu=True)
@@ -140,43 +291,69 @@ def prefetch_to_device(tensor: torch.Tensor, device: int | None = None) -> bool:
 
     if not gh200_uvm_enabled():
         return False
-    if not torch.cuda.is_available() or not tensor.is_cuda:
+    ptr, size = _hintable_span(tensor)
+    if size <= 0:
         return False
 
-    device = _current_cuda_device() if device is None else int(device)
-    cudart = _cudart()
-    if cudart is None:
+    handles = _cudart_handles()
+    device = handles.device if device is None else int(device)
+    if not _prefetch_span(handles, ptr, size, device):
         return False
+    _join_prefetch_stream(handles)
+    return True
 
-    size = _element_span_bytes(tensor)
-    if size <= 0:
-        return False
 
-    try:
-        ptr = tensor.data_ptr()
-    except Exception:
-        try:
-            ptr = tensor.storage().data_ptr()
-        except Exception:
-            return False
+def _iter_tensors(obj) -> Iterable[torch.Tensor]:
+    # Explicit stack instead of recursion: no generator frame per nesting level.
+    # Traversal order is not preserved, which hinting does not depend on.
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if type(value) is torch.Tensor or isinstance(value, torch.Tensor):
+            yield value
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def _unique_spans(tensors: Iterable[torch.Tensor]) -> List[Tuple[torch.Tensor, int, int]]:
+    """
+    Collapse ``tensors`` to one ``(tensor, ptr, size)`` entry per backing storage.
 
-    try:
-        cudart.cudaMemPrefetchAsync(ptr, size, device)
-        return True
-    except Exception as exc:  # pragma: no cover - best effort
-        logger.debug("cudaMemPrefetchAsync failed: %s", exc)
-        return False
+    Views and slices of the same storage share a single advise/prefetch over
+    the full storage span instead of issuing one driver call per view.
+    """
 
+    spans: Dict[int, Tuple[torch.Tensor, int, int]] = {}
+    for tensor in tensors:
+        ptr, size = _hintable_span(tensor)
+        if size > 0 and ptr not in spans:
+            spans[ptr] = (tensor, ptr, size)
+    return list(spans.values())
 
-def _iter_tensors(obj) -> Iterable[torch.Tensor]:
-    if isinstance(obj, torch.Tensor):
-        yield obj
-    elif isinstance(obj, Mapping):
-        for value in obj.values():
-            yield from _iter_tensors(value)
-    elif isinstance(obj, (list, tuple)):
-        for value in obj:
-            yield from _iter_tensors(value)
+
+def apply_cpu_residency_many(tensors: Iterable[torch.Tensor]) -> None:
+    """
+    Prefer CPU residency for ``tensors`` and prefetch them to the current device.
+
+    Tensors sharing a backing storage receive a single advise/prefetch.
+    """
+
+    if not gh200_uvm_enabled():
+        return
+
+    spans = _unique_spans(tensors)
+    if not spans:
+        return
+
+    handles = _cudart_handles()
+    prefetched = False
+    for tensor, ptr, size in spans:
+        _advise_span(handles, tensor, ptr, size, prefer_cpu=True)
+        prefetched |= _prefetch_span(handles, ptr, size, handles.device)
+    if prefetched:
+        _join_prefetch_stream(handles)
 
 
 def optimize_batch_for_gh200(batch: Mapping[str, object]) -> None:
@@ -191,12 +368,17 @@ def optimize_batch_for_gh200(batch: Mapping[str, object]) -> None:
     if not gh200_uvm_enabled():
         return
 
-    latents = batch.get("latents")
-    for tensor in _iter_tensors(latents):
-        prefer_cpu_residency(tensor)
+    latent_spans = _unique_spans(_iter_tensors(batch.get("latents")))
+    text_spans = _unique_spans(tensor for key in _GPU_RESIDENT_KEYS for tensor in _iter_tensors(batch.get(key)))
+    if not latent_spans and not text_spans:
+        return
 
-    for key in ("encoder_hidden_states", "text_embeddings", "pooled_prompt_embeds"):
-        value = batch.get(key)
-        for tensor in _iter_tensors(value):
-            prefer_gpu_residency(tensor)
-            prefetch_to_device(tensor)
+    handles = _cudart_handles()
+    for tensor, ptr, size in latent_spans:
+        _advise_span(handles, tensor, ptr, size, prefer_cpu=True)
+    prefetched = False
+    for tensor, ptr, size in text_spans:
+        _advise_span(handles, tensor, ptr, size, prefer_cpu=False)
+        prefetched |= _prefetch_span(handles, ptr, size, handles.device)
+    if prefetched:
+        _join_prefetch_stream(handles)
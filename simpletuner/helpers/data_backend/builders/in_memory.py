@@ -21,6 +21,8 @@ class InMemoryBackendBuilder(BaseBackendBuilder):
         compression = in_memory_config.get("compression")
         memory_limit = in_memory_config.get("memory_limit_gb")
         num_workers = in_memory_config.get("num_workers", 32)
+        decoder = in_memory_config.get("decoder")
+        decompressed_cache_gb = in_memory_config.get("decompressed_cache_gb")
 
         instance_dir = backend_cfg.get("instance_data_dir", config.instance_data_dir)
         if not instance_dir:
@@ -34,6 +36,8 @@ class InMemoryBackendBuilder(BaseBackendBuilder):
             compression=compression,
             memory_limit_gb=memory_limit,
             num_workers=num_workers,
+            decoder=decoder,
+            decompressed_cache_gb=decompressed_cache_gb,
         )
 
         return backend
@@ -0,0 +1,214 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from simpletuner.gh200.in_memory_backend import GH200InMemoryBackend
+
+
+class _StagedDirectoryTestCase(unittest.TestCase):
+    files = {}
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.root = self._tmpdir.name
+        for key, payload in self.files.items():
+            path = os.path.join(self.root, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as handle:
+                handle.write(payload)
+
+    def make_backend(self, **kwargs) -> GH200InMemoryBackend:
+        return GH200InMemoryBackend(accelerator=None, id="test", instance_data_dir=self.root, num_workers=2, **kwargs)
+
+
+class DecompressedCacheTests(_StagedDirectoryTestCase):
+    files = {f"{name}.png": name.encode() * 100 for name in "abcd"}
+
+    def make_backend(self, **kwargs) -> GH200InMemoryBackend:
+        # Room for exactly two 100-byte payloads.
+        return super().make_backend(compression="zlib", decompressed_cache_gb=250 / (1024**3), **kwargs)
+
+    def test_evicts_least_recently_used_within_byte_budget(self):
+        backend = self.make_backend()
+        for key in ("a.png", "b.png", "c.png"):
+            backend.read(key)
+        self.assertEqual(list(backend._decompressed_cache), ["b.png", "c.png"])
+        self.assertEqual(backend._decompressed_cache_bytes, 200)
+
+        backend.read("b.png")
+        backend.read("d.png")
+        self.assertEqual(list(backend._decompressed_cache), ["b.png", "d.png"])
+        self.assertEqual(backend._decompressed_cache_bytes, 200)
+
+    def test_payload_larger_than_budget_is_not_cached(self):
+        backend = self.make_backend()
+        backend.write("big.png", b"x" * 300)
+        self.assertEqual(backend.read("big.png"), b"x" * 300)
+        self.assertNotIn("big.png", backend._decompressed_cache)
+
+    def test_write_invalidates_cached_payload(self):
+        backend = self.make_backend()
+        backend.read("a.png")
+        backend.write("a.png", b"new")
+        self.assertNotIn("a.png", backend._decompressed_cache)
+        self.assertEqual(backend._decompressed_cache_bytes, 0)
+        self.assertEqual(backend.read("a.png"), b"new")
+
+    def test_delete_invalidates_cached_payload(self):
+        backend = self.make_backend()
+        backend.read("a.png")
+        backend.delete("a.png")
+        self.assertNotIn("a.png", backend._decompressed_cache)
+        self.assertEqual(backend._decompressed_cache_bytes, 0)
+        with self.assertRaises(KeyError):
+            backend.read("a.png")
+
+    def test_uncompressed_backend_does_not_cache(self):
+        backend = super().make_backend()
+        backend.read("a.png")
+        self.assertEqual(backend._decompressed_cache_limit, 0)
+        self.assertFalse(backend._decompressed_cache)
+
+
+class SlotStorageTests(_StagedDirectoryTestCase):
+    compression = None
+    files = {"a.png": b"alpha", "nested/b.png": b"bravo"}
+
+    def make_backend(self, **kwargs) -> GH200InMemoryBackend:
+        return super().make_backend(compression=self.compression, **kwargs)
+
+    def test_reads_staged_files(self):
+        backend = self.make_backend()
+        self.assertTrue(backend.exists("a.png"))
+        self.assertTrue(backend.exists(os.path.join("nested", "b.png")))
+        self.assertFalse(backend.exists("missing.png"))
+        self.assertEqual(backend.read("a.png"), b"alpha")
+        self.assertEqual(backend.read(os.path.join("nested", "b.png")), b"bravo")
+
+    def test_staged_entries_live_in_arena_only_without_compression(self):
+        backend = self.make_backend()
+        index = backend._key_index["a.png"]
+        if self.compression is None:
+            self.assertIsNone(backend._payloads[index])
+        else:
+            self.assertIsNotNone(backend._payloads[index])
+        self.assertEqual(backend.read("a.png"), b"alpha")
+
+    def test_read_as_byte_io(self):
+        backend = self.make_backend()
+        for key, expected in (("a.png", b"alpha"), ("nested/b.png", b"bravo")):
+            buffer = backend.read(key.replace("/", os.sep), as_byte_io=True)
+            self.assertIsInstance(buffer, BytesIO)
+            self.assertEqual(buffer.getvalue(), expected)
+
+    def test_write_new_key(self):
+        backend = self.make_backend()
+        backend.write("c.png", b"charlie")
+        self.assertTrue(backend.exists("c.png"))
+        self.assertIsNotNone(backend._payloads[backend._key_index["c.png"]])
+        self.assertEqual(backend.read("c.png"), b"charlie")
+        self.assertEqual(backend.read("c.png", as_byte_io=True).getvalue(), b"charlie")
+
+    def test_overwrite_replaces_arena_entry(self):
+        backend = self.make_backend()
+        backend.write("a.png", BytesIO(b"replaced"))
+        self.assertIsNotNone(backend._payloads[backend._key_index["a.png"]])
+        self.assertEqual(backend.read("a.png"), b"replaced")
+        # Neighbouring arena entries are untouched.
+        self.assertEqual(backend.read(os.path.join("nested", "b.png")), b"bravo")
+
+    def test_delete_and_rewrite(self):
+        backend = self.make_backend()
+        old_index = backend._key_index["a.png"]
+        backend.delete("a.png")
+        self.assertFalse(backend.exists("a.png"))
+        self.assertIsNone(backend._keys[old_index])
+        with self.assertRaises(KeyError):
+            backend.read("a.png")
+        # Deleting a missing key is a no-op.
+        backend.delete("a.png")
+
+        backend.write("a.png", b"again")
+        self.assertTrue(backend.exists("a.png"))
+        self.assertNotEqual(backend._key_index["a.png"], old_index)
+        self.assertEqual(backend.read("a.png"), b"again")
+
+    def test_write_rejects_unsupported_types(self):
+        backend = self.make_backend()
+        with self.assertRaises(TypeError):
+            backend.write("c.png", "not bytes")
+
+
+class CompressedSlotStorageTests(SlotStorageTests):
+    compression = "zlib"
+
+
+class ListFilesTests(_StagedDirectoryTestCase):
+    files = {
+        "a.png": b"a",
+        "b.PNG": b"b",
+        "c.jpg": b"c",
+        "nested/d.png": b"d",
+        "nested/deep/e.png": b"e",
+    }
+
+    def make_backend(self, **kwargs) -> GH200InMemoryBackend:
+        return super().make_backend(file_extensions=["png", "jpg"], **kwargs)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def test_groups_by_parent_and_filters_extension_case_insensitively(self):
+        backend = self.make_backend()
+        expected = [
+            (".", [], [self.path("a.png"), self.path("b.PNG")]),
+            ("nested", [], [self.path("nested/d.png")]),
+            (os.path.join("nested", "deep"), [], [self.path("nested/deep/e.png")]),
+        ]
+        self.assertEqual(backend.list_files(file_extensions=["png"]), expected)
+        self.assertEqual(backend.list_files(file_extensions=[".PNG"]), expected)
+
+    def test_multiple_extensions_and_default_extensions(self):
+        backend = self.make_backend()
+        root_files = [self.path("a.png"), self.path("b.PNG"), self.path("c.jpg")]
+        self.assertEqual(backend.list_files(file_extensions=["png", "jpg"])[0], (".", [], root_files))
+        self.assertEqual(backend.list_files(file_extensions=[])[0], (".", [], root_files))
+        self.assertEqual(backend.list_files(file_extensions=["jpg"]), [(".", [], [self.path("c.jpg")])])
+
+    def test_unknown_extension_returns_empty(self):
+        backend = self.make_backend()
+        self.assertEqual(backend.list_files(file_extensions=["webp"]), [])
+
+    def test_deleted_keys_are_excluded(self):
+        backend = self.make_backend()
+        backend.list_files(file_extensions=["png"])
+        backend.delete("a.png")
+        backend.delete(os.path.join("nested", "deep", "e.png"))
+        self.assertEqual(
+            backend.list_files(file_extensions=["png"]),
+            [(".", [], [self.path("b.PNG")]), ("nested", [], [self.path("nested/d.png")])],
+        )
+        backend.delete("c.jpg")
+        self.assertEqual(backend.list_files(file_extensions=["jpg"]), [])
+
+    def test_written_keys_appear(self):
+        backend = self.make_backend()
+        backend.list_files(file_extensions=["png"])
+        backend.write(os.path.join("nested", "f.png"), b"f")
+        backend.write(os.path.join("other", "g.webp"), b"g")
+        listing = dict((folder, files) for folder, _, files in backend.list_files(file_extensions=["png"]))
+        self.assertEqual(listing["nested"], [self.path("nested/d.png"), self.path("nested/f.png")])
+        self.assertNotIn("other", listing)
+        self.assertEqual(backend.list_files(file_extensions=["webp"]), [("other", [], [self.path("other/g.webp")])])
+
+    def test_keys_outside_root_are_returned_unchanged(self):
+        backend = self.make_backend()
+        outside = os.path.join(tempfile.gettempdir(), "outside", "x.webp")
+        backend.write(outside, b"x")
+        self.assertEqual(backend.list_files(file_extensions=["webp"]), [(os.path.dirname(outside), [], [outside])])
+
+
+if __name__ == "__main__":
+    unittest.main()
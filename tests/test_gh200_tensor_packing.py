@@ -0,0 +1,63 @@
+import unittest
+from io import BytesIO
+
+import torch
+
+from simpletuner.gh200.in_memory_backend import _PACKED_TENSOR_MAGIC, _serialize_tensor, _unpack_tensor
+
+
+def _is_packed(payload: bytes) -> bool:
+    return payload[: len(_PACKED_TENSOR_MAGIC)] == _PACKED_TENSOR_MAGIC
+
+
+def _round_trip(tensor: torch.Tensor) -> torch.Tensor:
+    payload = _serialize_tensor(tensor)
+    if _is_packed(payload):
+        return _unpack_tensor(payload)
+    return torch.load(BytesIO(payload), map_location="cpu")
+
+
+class PackedTensorRoundTripTests(unittest.TestCase):
+    def assert_round_trip(self, tensor: torch.Tensor, *, packed: bool = True) -> torch.Tensor:
+        self.assertEqual(_is_packed(_serialize_tensor(tensor)), packed)
+        restored = _round_trip(tensor)
+        self.assertEqual(restored.dtype, tensor.dtype)
+        self.assertEqual(restored.shape, tensor.shape)
+        self.assertTrue(torch.equal(restored, tensor))
+        return restored
+
+    def test_bfloat16(self):
+        self.assert_round_trip(torch.randn(4, 3, dtype=torch.float32).to(torch.bfloat16))
+
+    def test_bool(self):
+        self.assert_round_trip(torch.tensor([[True, False, True], [False, False, True]]))
+
+    def test_zero_dim(self):
+        self.assert_round_trip(torch.tensor(3.5, dtype=torch.float32))
+
+    def test_empty(self):
+        self.assert_round_trip(torch.empty(0, 7, dtype=torch.float16))
+
+    def test_non_contiguous(self):
+        tensor = torch.arange(12, dtype=torch.int64).reshape(3, 4).t()
+        self.assertFalse(tensor.is_contiguous())
+        self.assert_round_trip(tensor)
+
+    def test_unpacked_tensor_does_not_alias_payload(self):
+        payload = _serialize_tensor(torch.zeros(4, dtype=torch.int32))
+        restored = _unpack_tensor(payload)
+        restored += 1
+        self.assertTrue(torch.equal(_unpack_tensor(payload), torch.zeros(4, dtype=torch.int32)))
+
+    def test_unlisted_dtype_falls_back_to_torch_save(self):
+        self.assert_round_trip(torch.randn(2, 3, dtype=torch.complex64), packed=False)
+
+    def test_too_many_dims_falls_back_to_torch_save(self):
+        tensor = torch.empty([1] * 256, dtype=torch.float32)
+        payload = _serialize_tensor(tensor)
+        self.assertFalse(_is_packed(payload))
+        self.assertEqual(torch.load(BytesIO(payload), map_location="cpu").shape, tensor.shape)
+
+
+if __name__ == "__main__":
+    unittest.main()